@@ -1,37 +1,69 @@
+import asyncio
+import concurrent.futures
+import copy
+import hashlib
+import io
+import json
 import os
-import tempfile
+import re
+import threading
+from collections import OrderedDict
+import zlib
 import streamlit as st
 from PyPDF2 import PdfReader
-import pdfplumber
+import pypdfium2 as pdfium
 import google.generativeai as genai
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv  # ✅ FIXED
 
 # ========== CONFIGURATION ========== #
 load_dotenv()  # ✅ FIXED
 
-# Configure Gemini (initial setup, will be used later in function)
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-
 MODEL_NAME = "gemini-1.5-pro"
 
 # Constants
 MAX_PDF_SIZE_MB = 50
 MAX_SLIDES = 10
 PROCESSING_CHUNK_SIZE = 15000
+MAX_EXTRACT_PAGES = 15  # enough pages to fill PROCESSING_CHUNK_SIZE on typical documents
 MIN_CONTENT_LENGTH = 100
+SLIDE_CONTENT_TIMEOUT = 120  # seconds to wait for the concurrent per-slide requests
+MAX_CACHED_STRUCTURES = 64  # generated outlines kept for reuse across sessions
+
+# Outline line: "Slide 2: [Introduction] - content"
+SLIDE_RE = re.compile(r'^Slide\s+\d+:\s*(?:\[([^\]]+)\]|(.+?))\s+-(?:\s+|$)(.*)$')
+
+# Lines that are already list items: "-", "•" or "*" bullets, or numbered like "1." / "2)"
+BULLET_LINE_RE = re.compile(r'^\s*(?:[-•*]|\d+[.)]\s)')
+
+# Bullets used when Gemini cannot produce content for a slide
+FALLBACK_SLIDE_CONTENT = "- Document point 1 (Page X)\n- Document point 2 (Page Y)\n- Document point 3 (Page Z)"
+
+# Slide content formatting
+CONTENT_FONT_SIZE = Pt(18)
+CONTENT_FONT_COLOR = RGBColor(0, 0, 0)
+
+# Pre-formatted bullet paragraph (left-aligned), cloned for every line of slide content
+BULLET_PARAGRAPH_TEMPLATE = parse_xml(
+    f'<a:p {nsdecls("a")}><a:pPr algn="l"/>'
+    f'<a:r><a:rPr lang="en-US" sz="{CONTENT_FONT_SIZE.centipoints}" dirty="0">'
+    f'<a:solidFill><a:srgbClr val="{CONTENT_FONT_COLOR}"/></a:solidFill>'
+    '</a:rPr><a:t></a:t></a:r></a:p>'
+)
 
 # ========== CORE FUNCTIONS ========== #
 
-def configure_gemini() -> genai.GenerativeModel:
-    """Configure Gemini API with error handling"""
+@st.cache_resource(show_spinner=False)
+def configure_gemini(api_key: Optional[str]) -> genai.GenerativeModel:
+    """Configure Gemini API with error handling (cached per API key)"""
     try:
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))  # ✅ FIXED
+        genai.configure(api_key=api_key)
         return genai.GenerativeModel(
             MODEL_NAME,
             generation_config={
@@ -47,79 +79,164 @@ def configure_gemini() -> genai.GenerativeModel:
 
 def extract_text_from_pdf(pdf_file) -> Tuple[Optional[str], Optional[str]]:
     """Robust text extraction with multiple fallbacks"""
-    pdf_file.seek(0)
-    text = ""
+    data = pdf_file.getvalue()
+    parts = []
+    total_len = 0
     
-    # Try pdfplumber first
+    # Try pdfium first
     try:
-        with pdfplumber.open(pdf_file) as pdf:
-            for i, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text += f"\n\n[Page {i+1}]\n{page_text}"
-                if len(text) > PROCESSING_CHUNK_SIZE:
+        with pdfium.PdfDocument(data) as pdf:
+            for i in range(min(len(pdf), MAX_EXTRACT_PAGES)):
+                if total_len > PROCESSING_CHUNK_SIZE:
                     break
+                page = pdf[i]
+                textpage = page.get_textpage()
+                try:
+                    page_text = textpage.get_text_bounded()
+                finally:
+                    # Release C-side page memory right away
+                    textpage.close()
+                    page.close()
+                if page_text:
+                    parts.append(f"\n\n[Page {i+1}]\n{page_text}")
+                    total_len += len(parts[-1])
     except Exception as e:
-        st.warning(f"pdfplumber failed: {str(e)}")
+        st.warning(f"pdfium failed: {str(e)}")
     
     # Fallback to PyPDF2 if needed
-    if len(text) < MIN_CONTENT_LENGTH:
-        pdf_file.seek(0)
+    if total_len < MIN_CONTENT_LENGTH:
         try:
-            reader = PdfReader(pdf_file)
-            for i, page in enumerate(reader.pages):
+            reader = PdfReader(io.BytesIO(data))
+            for i, page in enumerate(reader.pages[:MAX_EXTRACT_PAGES]):
+                if total_len > PROCESSING_CHUNK_SIZE:
+                    break
                 page_text = page.extract_text()
                 if page_text:
-                    text += f"\n\n[Page {i+1}]\n{page_text}"
-                if len(text) > PROCESSING_CHUNK_SIZE:
-                    break
+                    parts.append(f"\n\n[Page {i+1}]\n{page_text}")
+                    total_len += len(parts[-1])
         except Exception as e:
             st.warning(f"PyPDF2 failed: {str(e)}")
     
+    text = "".join(parts)
     if len(text) > MIN_CONTENT_LENGTH:
         return text, None
     return None, "Failed to extract sufficient text (document may be scanned)"
 
-def generate_slide_structure(model, pdf_text: str, ppt_title: str) -> Tuple[Optional[str], Optional[str]]:
-    """Generate structured slide outline with validation"""
+@st.cache_resource(show_spinner=False)
+def _slide_structure_cache() -> Tuple["OrderedDict[Tuple[str, str], List[dict]]", threading.Lock]:
+    """Process-wide LRU store of validated outlines keyed by (document hash, title), with its lock"""
+    return OrderedDict(), threading.Lock()
+
+def _request_slide_structure(model, pdf_text: str, ppt_title: str,
+                             on_chunk: Optional[Callable[[str], None]] = None) -> List[dict]:
+    """Streamed Gemini call for the slide outline; raises on failure"""
+    prompt = f"""
+    Create a detailed PowerPoint presentation from this document for title: "{ppt_title}".
+
+    DOCUMENT CONTENT:
+    {pdf_text[:PROCESSING_CHUNK_SIZE]}
+
+    REQUIRED OUTPUT FORMAT (JSON):
+    {{"slides": [
+        {{"title": "Title Slide", "bullets": ["[Document summary]"]}},
+        {{"title": "Introduction", "bullets": ["[3-5 specific points from document]"]}},
+        {{"title": "[Key Finding 1]", "bullets": ["[Detailed content from document with page reference]"]}},
+        {{"title": "[Key Finding 2]", "bullets": ["[Detailed content from document with page reference]"]}},
+        {{"title": "Conclusion", "bullets": ["[Actionable takeaways]"]}}
+    ]}}
+
+    RULES:
+    - Create exactly 5 slides
+    - Give every slide except the title slide 3-5 bullets with concrete details
+    - Include specific facts/numbers/quotes when available
+    - Never invent information not in the document
+    - Include page references like (Page 5) when possible
+    """
+
+    response = model.generate_content(
+        prompt,
+        generation_config={
+            "response_mime_type": "application/json",
+            "max_output_tokens": 4096,
+        },
+        stream=True
+    )
+    chunks = []
+    for chunk in response:
+        chunks.append(chunk.text)
+        if on_chunk:
+            on_chunk(chunk.text)
+    result = json.loads("".join(chunks))
+    slides = result.get("slides") if isinstance(result, dict) else None
+    if not isinstance(slides, list) or not slides:
+        raise ValueError("no slides returned")
+    return [_normalize_slide(slide) for slide in slides]
+
+def _normalize_slide(slide) -> dict:
+    """Validate one generated slide as {"title": str, "bullets": [str, ...]}"""
+    if not isinstance(slide, dict) or not isinstance(slide.get("title"), str):
+        raise ValueError(f"malformed slide: {slide!r}")
+    bullets = slide.get("bullets", [])
+    if isinstance(bullets, str):
+        bullets = [line.strip().lstrip('-•*') for line in bullets.splitlines()]
+    if not isinstance(bullets, list):
+        raise ValueError(f"malformed bullets for slide {slide['title']!r}")
+    return {
+        "title": slide["title"].strip().strip('[]'),
+        "bullets": [str(bullet).strip() for bullet in bullets if str(bullet).strip()],
+    }
+
+def generate_slide_structure(model, pdf_text: str, ppt_title: str,
+                             on_chunk: Optional[Callable[[str], None]] = None) -> Tuple[Optional[List[dict]], Optional[str]]:
+    """Generate slide outline and bullet content in a single request"""
     try:
-        prompt = f"""
-        Create a detailed PowerPoint outline from this document for title: "{ppt_title}".
+        # Cached by hand: st.cache_data cannot replay UI updates made through on_chunk
+        cache, lock = _slide_structure_cache()
+        key = (hashlib.sha1(pdf_text.encode()).hexdigest(), ppt_title)
+        with lock:
+            slides = cache.get(key)
+            if slides is not None:
+                cache.move_to_end(key)
+        if slides is None:
+            # Only outlines that passed validation get here; failures raise past the cache
+            slides = _request_slide_structure(model, pdf_text, ppt_title, on_chunk)
+            with lock:
+                cache[key] = slides
+                while len(cache) > MAX_CACHED_STRUCTURES:
+                    cache.popitem(last=False)
+        return slides, None
+    except Exception as e:
+        return None, f"Structure generation failed: {str(e)}"
 
+def format_slide_structure(ppt_title: str, slides: List[dict]) -> str:
+    """Render generated slides as an editable outline, bullets separated by '; '"""
+    # The title slide is found by name; Gemini does not always put it first, or include it at all
+    title_slides = [slide for slide in slides if slide["title"].lower() == "title slide"]
+    summary = title_slides[0]["bullets"][0] if title_slides and title_slides[0]["bullets"] else ""
+    lines = [f'Slide 1: [Title Slide] - Title: "{ppt_title}", Subtitle: "{summary}"']
+    for slide in slides:
+        slide_title, bullets = slide["title"], slide["bullets"]
+        if slide_title.lower() == "title slide":
+            continue
+        # Keep each bullet on one line and free of the separator so it round-trips through the outline
+        bullets = [" ".join(bullet.split()).replace("; ", ", ") for bullet in bullets]
+        lines.append(f"Slide {len(lines) + 1}: [{slide_title}] - " + "; ".join(bullets))
+    return "\n".join(lines)
+
+def build_content_prompt_prefix(pdf_text: str) -> str:
+    """Document part of the slide content prompt, shared by every slide in a deck"""
+    return f"""
         DOCUMENT CONTENT:
         {pdf_text[:PROCESSING_CHUNK_SIZE]}
-
-        REQUIRED OUTPUT FORMAT:
-        Slide 1: [Title Slide] - Title: "{ppt_title}", Subtitle: "[Document summary]"
-        Slide 2: [Introduction] - [3-5 specific points from document]
-        Slide 3: [Key Finding 1] - [Detailed content from document with page reference]
-        Slide 4: [Key Finding 2] - [Detailed content from document with page reference]
-        Slide 5: [Conclusion] - [Actionable takeaways]
-
-        RULES:
-        - Create exactly 5 slides
-        - Each slide must have concrete content instructions
-        - Include specific facts/numbers/quotes when available
-        - Never invent information not in the document
-        - Include page references like (Page 5) when possible
         """
-        
-        response = model.generate_content(prompt)
-        return response.text, None
-    except Exception as e:
-        return None, f"Structure generation failed: {str(e)}"
 
-def generate_slide_content(model, pdf_text: str, slide_title: str) -> str:
-    """Generate accurate slide content with validation"""
-    try:
-        prompt = f"""
+def _content_prompt_suffix(slide_title: str) -> str:
+    """Slide-specific part of the slide content prompt"""
+    return f"""
         Generate specific content for PowerPoint slide titled: "{slide_title}"
 
-        DOCUMENT CONTENT:
-        {pdf_text[:PROCESSING_CHUNK_SIZE]}
-
         REQUIREMENTS:
-        1. Extract 3-5 specific points from the document
+        1. Extract 3-5 specific points from the document above
         2. Each point must include concrete details
         3. Use only factual information from the document
         4. Format as bullet points with page references like (Page 3)
@@ -130,21 +247,106 @@ def generate_slide_content(model, pdf_text: str, slide_title: str) -> str:
         - Customer satisfaction reached 4.8/5 (Page 8)
         - New products launched in September (Page 12)
         """
-        
-        response = model.generate_content(prompt)
-        content = response.text
-        
-        # Ensure we have proper bullet points
-        if not content.strip():
-            content = "- Key point from document (Page X)\n- Important finding (Page Y)\n- Relevant detail (Page Z)"
-        elif not any(marker in content for marker in ['-', '•', '*']):
-            content = "- " + content.replace('\n', '\n- ')
-        
-        return content
-    except Exception:
-        return "- Document point 1 (Page X)\n- Document point 2 (Page Y)\n- Document point 3 (Page Z)"
-
-def create_presentation(ppt_title: str, slide_structure: str, model, pdf_text: str) -> Optional[str]:
+
+def ensure_bullets(content: str) -> str:
+    """Ensure we have proper bullet points"""
+    if not content.strip():
+        return "- Key point from document (Page X)\n- Important finding (Page Y)\n- Relevant detail (Page Z)"
+    return "\n".join(
+        line if not line.strip() or BULLET_LINE_RE.match(line) else "- " + line
+        for line in content.splitlines()
+    )
+
+async def generate_slide_content(model, prompt_prefix: str, slide_title: str) -> str:
+    """Generate accurate slide content with validation; raises on failure"""
+    prompt = prompt_prefix + _content_prompt_suffix(slide_title)
+
+    response = await model.generate_content_async(prompt, stream=True)
+    content = "".join([chunk.text async for chunk in response])
+
+    return ensure_bullets(content)
+
+@st.cache_data(show_spinner=False)
+def generate_all_slide_contents(_model, pdf_text: str, slide_titles: Tuple[str, ...]) -> Dict[str, str]:
+    """Generate content for every slide title in one JSON request; raises on failure"""
+    prompt = build_content_prompt_prefix(pdf_text) + f"""
+        For each of the following PowerPoint slide titles, generate specific slide content:
+        {json.dumps(list(slide_titles))}
+
+        REQUIREMENTS:
+        1. Extract 3-5 specific points from the document above for every title
+        2. Each point must include concrete details
+        3. Use only factual information from the document
+        4. Include page references like (Page 3)
+        5. If no specific content found, use general document themes
+
+        REQUIRED OUTPUT FORMAT (JSON, keys are the exact slide titles):
+        {{"<slide title>": ["Revenue increased by 23% in Q3 (Page 5)", "..."]}}
+        """
+
+    response = _model.generate_content(
+        prompt,
+        generation_config={
+            "response_mime_type": "application/json",
+            "max_output_tokens": 4096,
+        }
+    )
+    results = json.loads(response.text)
+    contents = {}
+    for slide_title in slide_titles:
+        bullets = results.get(slide_title)
+        if isinstance(bullets, list):
+            bullets = "\n".join(f"- {str(bullet).strip()}" for bullet in bullets if str(bullet).strip())
+        if isinstance(bullets, str):
+            contents[slide_title] = ensure_bullets(bullets)
+    return contents
+
+def write_bullets(text_frame, content: str) -> None:
+    """Replace text frame paragraphs with formatted copies of the bullet template"""
+    txBody = text_frame._txBody
+    for paragraph in txBody.findall(qn("a:p")):
+        txBody.remove(paragraph)
+    for line in content.split("\n"):
+        paragraph = copy.deepcopy(BULLET_PARAGRAPH_TEMPLATE)
+        # Run .text escapes control characters; vertical tabs become line breaks, as in python-pptx
+        segments = line.split("\v")
+        run = paragraph.find(qn("a:r"))
+        run.text = segments[0]
+        for segment in segments[1:]:
+            paragraph.add_br()
+            run = copy.deepcopy(run)
+            run.text = segment
+            paragraph.append(run)
+        txBody.append(paragraph)
+
+async def _gather_slide_contents(model, pdf_text: str, slide_titles: Tuple[str, ...]) -> List[str]:
+    """Generate content for all slides concurrently, preserving title order"""
+    prompt_prefix = build_content_prompt_prefix(pdf_text)
+    return await asyncio.gather(
+        *[generate_slide_content(model, prompt_prefix, slide_title) for slide_title in slide_titles]
+    )
+
+@st.cache_resource(show_spinner=False)
+def _gemini_event_loop() -> asyncio.AbstractEventLoop:
+    """Long-lived loop for async Gemini calls; the SDK's grpc-aio client is bound to one loop"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+@st.cache_data(show_spinner=False)
+def generate_slide_contents(_model, pdf_text: str, slide_titles: Tuple[str, ...]) -> List[str]:
+    """Cached slide content generation keyed on document text and slide titles; failures raise and are not cached"""
+    future = asyncio.run_coroutine_threadsafe(
+        _gather_slide_contents(_model, pdf_text, slide_titles), _gemini_event_loop()
+    )
+    try:
+        return future.result(timeout=SLIDE_CONTENT_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        # Stop the hung requests on the shared loop; the caller falls back to placeholder content
+        future.cancel()
+        raise
+
+def create_presentation(ppt_title: str, slide_structure: str, model, pdf_text: str) -> Optional[bytes]:
     """Create PowerPoint with guaranteed content in slides"""
     try:
         prs = Presentation()
@@ -162,36 +364,58 @@ def create_presentation(ppt_title: str, slide_structure: str, model, pdf_text: s
         # Parse slide structure
         slides_to_create = []
         for line in slide_structure.split('\n'):
-            if line.startswith('Slide'):
-                parts = line.split(' - ')
-                if len(parts) >= 2:
-                    slide_title = parts[0].split(': ')[1].strip('[]')
-                    slides_to_create.append(slide_title)
-
-        for slide_title in slides_to_create[:MAX_SLIDES]:
-            if '[Title Slide]' in slide_title:
+            m = SLIDE_RE.match(line)
+            if m:
+                slides_to_create.append(((m.group(1) or m.group(2)).strip(), m.group(3)))
+
+        slide_titles = []
+        slide_contents = {}
+        for slide_title, slide_text in slides_to_create[:MAX_SLIDES]:
+            if 'Title Slide' in slide_title:
                 continue
-            content = generate_slide_content(model, pdf_text, slide_title)
-            slide_layout = prs.slide_layouts[1]
-            slide = prs.slides.add_slide(slide_layout)
-            title_shape = slide.shapes.title
-            content_shape = slide.placeholders[1]
+            slide_titles.append(slide_title)
+            bullets = [bullet.strip() for bullet in slide_text.split('; ') if bullet.strip()]
+            if bullets:
+                slide_contents[slide_title] = "\n".join(f"- {bullet}" for bullet in bullets)
+
+        # Bullets come from the (possibly edited) outline; only slides left without any need a new request
+        missing_titles = [t for t in slide_titles if t not in slide_contents]
+        if missing_titles:
+            try:
+                generated = generate_all_slide_contents(model, pdf_text, tuple(missing_titles))
+            except Exception:
+                generated = {}
+            # Titles the batch response skipped fall back to one request each
+            leftover_titles = [t for t in missing_titles if t not in generated]
+            if leftover_titles:
+                try:
+                    fallback = generate_slide_contents(model, pdf_text, tuple(leftover_titles))
+                except Exception:
+                    fallback = [FALLBACK_SLIDE_CONTENT] * len(leftover_titles)
+                generated = {**generated, **dict(zip(leftover_titles, fallback))}
+            slide_contents = {**slide_contents, **generated}
+
+        content_layout = prs.slide_layouts[1]
+        for slide_title in slide_titles:
+            content = slide_contents[slide_title]
+            slide = prs.slides.add_slide(content_layout)
+            title_shape, content_shape = slide.shapes.title, slide.placeholders[1]
             title_shape.text = slide_title.replace('[', '').replace(']', '')
-            content_shape.text = content
-            for paragraph in content_shape.text_frame.paragraphs:
-                paragraph.font.size = Pt(18)
-                paragraph.font.color.rgb = RGBColor(0, 0, 0)
-                paragraph.alignment = PP_ALIGN.LEFT
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pptx') as tmp:
-            prs.save(tmp.name)
-            return tmp.name
+            write_bullets(content_shape.text_frame, content)
+
+        buf = io.BytesIO()
+        prs.save(buf)
+        return buf.getvalue()
     except Exception as e:
         st.error(f"PPT creation failed: {str(e)}")
         return None
 
 # ========== STREAMLIT UI ========== #
 
+def load_pdf_text() -> str:
+    """Decompress the extracted document text held in session state"""
+    return zlib.decompress(st.session_state.pdf_text_gz).decode()
+
 def main():
     st.set_page_config(
         page_title="PDF to PowerPoint Pro",
@@ -203,7 +427,7 @@ def main():
     st.write("Upload a PDF to generate a professional PowerPoint presentation")
 
     try:
-        model = configure_gemini()
+        model = configure_gemini(os.getenv("GEMINI_API_KEY"))
     except Exception as e:
         st.error(f"Failed to initialize AI service: {str(e)}")
         st.stop()
@@ -215,42 +439,60 @@ def main():
             st.error(f"File too large (max {MAX_PDF_SIZE_MB}MB)")
             return
 
-        with st.spinner("Extracting text from PDF..."):
-            pdf_text, error = extract_text_from_pdf(pdf_file)
-            if error:
-                st.error(error)
+        # Every widget interaction reruns the script; only extract when a new file arrives
+        if st.session_state.get('pdf_file_id') != pdf_file.file_id:
+            # Reject non-PDF uploads before handing the whole file to the extractors
+            if pdf_file.read(5) != b"%PDF-":
+                st.error("Uploaded file is not a valid PDF")
                 return
-            st.session_state.pdf_text = pdf_text
+            with st.spinner("Extracting text from PDF..."):
+                pdf_text, error = extract_text_from_pdf(pdf_file)
+                if error:
+                    st.error(error)
+                    return
+                # Kept compressed between reruns; see load_pdf_text
+                st.session_state.pdf_text_gz = zlib.compress(pdf_text.encode(), level=1)
+                st.session_state.pdf_file_id = pdf_file.file_id
+                # The outline belongs to the previous document
+                st.session_state.pop('slide_structure', None)
 
         ppt_title = st.text_input("Presentation Title", "Business Report")
 
         if st.button("Analyze Document"):
             with st.spinner("Creating slide structure..."):
-                slide_structure, error = generate_slide_structure(model, pdf_text, ppt_title)
+                preview = st.empty()
+                streamed = []
+
+                def show_progress(chunk_text: str) -> None:
+                    streamed.append(chunk_text)
+                    preview.code("".join(streamed), language="json")
+
+                slides, error = generate_slide_structure(model, load_pdf_text(), ppt_title, show_progress)
+                preview.empty()
                 if error:
                     st.error(error)
                 else:
-                    st.session_state.slide_structure = slide_structure
+                    st.session_state.slide_structure = format_slide_structure(ppt_title, slides)
 
         if 'slide_structure' in st.session_state:
             st.subheader("Slide Structure")
             edited_structure = st.text_area(
                 "Review and edit if needed:",
                 value=st.session_state.slide_structure,
-                height=300
+                height=300,
+                help="Edit slide titles and bullets (bullets are separated by '; '). "
+                     "Leave a slide's bullets empty to have them generated from the document."
             )
 
             if st.button("Generate PowerPoint", type="primary"):
                 with st.spinner("Creating presentation..."):
-                    ppt_path = create_presentation(
+                    ppt_bytes = create_presentation(
                         ppt_title,
                         edited_structure,
                         model,
-                        st.session_state.pdf_text
+                        load_pdf_text()
                     )
-                    if ppt_path:
-                        with open(ppt_path, "rb") as f:
-                            ppt_bytes = f.read()
+                    if ppt_bytes:
                         st.success("✅ Presentation generated successfully!")
                         st.download_button(
                             label="Download PowerPoint",
@@ -258,10 +500,6 @@ def main():
                             file_name=f"{ppt_title.replace(' ', '_')}.pptx",
                             mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
                         )
-                        try:
-                            os.unlink(ppt_path)
-                        except:
-                            pass
 
 if __name__ == "__main__":
     main()